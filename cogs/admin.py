@@ -0,0 +1,134 @@
+from discord.ext import commands
+import json
+import time
+import traceback
+
+from config import EXTENSIONS
+from seasons import start_new_season
+from storage import flush_xp_data
+
+class Admin(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.services = bot.services
+
+    def _resolve(self, name):
+        return name if name.startswith("cogs.") else f"cogs.{name}"
+
+    @commands.command(name="reload")
+    @commands.is_owner()
+    async def reload(self, ctx, name: str = None):
+        """Hot reload one extension, or all of them if no name is given (bot owner only)"""
+        targets = [self._resolve(name)] if name else list(self.bot.extensions)
+        for ext in targets:
+            start = time.perf_counter()
+            try:
+                await self.bot.reload_extension(ext)
+            except commands.ExtensionNotLoaded:
+                await self.bot.load_extension(ext)
+            except Exception as e:
+                await ctx.send(f"Failed to reload `{ext}`: {e}")
+                traceback.print_exc()
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"Reloaded {ext} in {elapsed:.1f}ms")
+            await ctx.send(f"Reloaded `{ext}` in {elapsed:.1f}ms :D")
+
+    @commands.command(name="load")
+    @commands.is_owner()
+    async def load(self, ctx, name: str):
+        """Load an extension (bot owner only)"""
+        ext = self._resolve(name)
+        try:
+            await self.bot.load_extension(ext)
+            await ctx.send(f"Loaded `{ext}` :D")
+        except Exception as e:
+            await ctx.send(f"Failed to load `{ext}`: {e}")
+            traceback.print_exc()
+
+    @commands.command(name="unload")
+    @commands.is_owner()
+    async def unload(self, ctx, name: str):
+        """Unload an extension (bot owner only)"""
+        ext = self._resolve(name)
+        if ext == __name__:
+            return await ctx.send("I can't unload the admin extension, use !reload admin instead")
+        try:
+            await self.bot.unload_extension(ext)
+            await ctx.send(f"Unloaded `{ext}`")
+        except Exception as e:
+            await ctx.send(f"Failed to unload `{ext}`: {e}")
+            traceback.print_exc()
+
+    @commands.command(name="extensions")
+    @commands.is_owner()
+    async def extensions(self, ctx):
+        """List loaded extensions (bot owner only)"""
+        loaded = set(self.bot.extensions)
+        lines = [f"{'✅' if ext in loaded else '❌'} `{ext}`" for ext in EXTENSIONS]
+        await ctx.send("\n".join(lines))
+
+    @commands.command(name="startup")
+    @commands.is_owner()
+    async def startup(self, ctx):
+        """Show how long each startup phase took (bot owner only)"""
+        if not self.services.phases:
+            return await ctx.send("No startup timings recorded yet!")
+        lines = [f"`{phase}`: {elapsed:.0f}ms" for phase, elapsed in self.services.phases.items()]
+        await ctx.send("Startup timings (since process start):\n" + "\n".join(lines))
+
+    # only needed when slash command names/options changed, a plain reload doesn't need a resync
+    @commands.command(name="sync")
+    @commands.is_owner()
+    async def sync(self, ctx):
+        """Sync slash commands with Discord (bot owner only)"""
+        try:
+            synced = await self.bot.tree.sync()
+            await ctx.send(f"Synced {len(synced)} command(s)")
+        except Exception as e:
+            await ctx.send(f"Failed to sync commands: {e}")
+
+    @commands.command(name="newseason")
+    @commands.is_owner()
+    async def newseason(self, ctx):
+        """Start the next leveling season (bot owner only)"""
+        await self.services.wait_until_warm()
+        if not self.services.season_loaded:
+            return await ctx.send("I couldn't load the current season at startup, so I won't start a new one (restart me and try again)")
+        pending = self.services.season.get("pending_archive")
+        if pending is not None:
+            return await ctx.send(f"Season {pending} is still being archived, try again in a bit!")
+        season = await start_new_season(self.services)
+        await ctx.send(f"Season {season['number']} has started! Season {season['pending_archive']} is being archived in the background :D")
+
+    # this is pure for debugging purposes DO NOT USE THIS OR IT CAN DESYNC THE BOT. 
+    @commands.command(name="forcesave")
+    @commands.is_owner()
+    async def forcesave(self, ctx):
+        """Force save XP data (bot owner only)"""
+        # saving before the store is loaded would overwrite it with nothing
+        await self.services.wait_until_warm()
+        try:
+            await flush_xp_data(self.services)
+            await ctx.send("XP data forcibly saved!")
+        except Exception as e:
+            await ctx.send(f"Error saving XP data: {e}")
+            traceback.print_exc()
+
+    @commands.command(name="rawxp")
+    @commands.is_owner()
+    async def rawxp(self, ctx):
+        """View raw XP data (bot owner only)"""
+        await self.services.wait_until_warm()
+        if len(self.services.user_xp) == 0:
+            await ctx.send("No XP data found!")
+            return
+
+        data_str = json.dumps(self.services.user_xp, indent=2)
+        if len(data_str) > 1900: 
+            await ctx.send(f"XP data (truncated, {len(self.services.user_xp)} users):\n```json\n{data_str[:1900]}...\n```")
+        else:
+            await ctx.send(f"XP data ({len(self.services.user_xp)} users):\n```json\n{data_str}\n```")
+
+async def setup(bot):
+    await bot.add_cog(Admin(bot))
@@ -0,0 +1,302 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+import aiohttp
+import random
+
+from guild_config import resolve_role
+
+class Fun(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.services = bot.services
+
+    @commands.hybrid_command(name="hug", description="Give someone a big hug!")
+    async def hug(self, ctx, member: discord.Member):
+        if not member:
+            return await ctx.send("Please mention someone to hug!")
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get('https://api.waifu.pics/sfw/hug') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    embed = discord.Embed(
+                        title=f"{ctx.author.name} gives {member.name} a big hug! :D",
+                        color=discord.Color.purple()
+                    )
+                    embed.set_image(url=data['url'])
+                    await ctx.send(embed=embed)
+                else:
+                    await ctx.send(f"HUGGIES TO {member.mention} from {ctx.author.mention}!!!")
+
+    @commands.hybrid_command(name="slap", description="Slap someone!")
+    async def slap(self, ctx, member: discord.Member):
+        if not member:
+            return await ctx.send("Please mention someone to slap!")
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get('https://api.waifu.pics/sfw/slap') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    embed = discord.Embed(
+                        title=f"{ctx.author.name} slaps {member.name}!! ",
+                        color=discord.Color.red()
+                    )
+                    embed.set_image(url=data['url'])
+                    await ctx.send(embed=embed)
+                else:
+                    await ctx.send(f"{ctx.author.mention} slaps {member.mention}!")
+
+    @commands.hybrid_command(name="cat", description="Get a random cat picture")
+    async def cat(self, ctx):
+        async with aiohttp.ClientSession() as session:
+            async with session.get('https://api.thecatapi.com/v1/images/search') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    embed = discord.Embed(title="Meowww! :cat:", color=discord.Color.purple())
+                    embed.set_image(url=data[0]['url'])
+                    await ctx.send(embed=embed)
+                else:
+                    await ctx.send("Oopsie! Couldn't find a kitty right now :(")
+
+    @commands.hybrid_command(name="dog", description="Get a random dog picture")
+    async def dog(self, ctx):
+        async with aiohttp.ClientSession() as session:
+            async with session.get('https://dog.ceo/api/breeds/image/random') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    embed = discord.Embed(title="Woof Woof! :dog:", color=discord.Color.green())
+                    embed.set_image(url=data['message'])
+                    await ctx.send(embed=embed)
+                else:
+                    await ctx.send("Oopsie! Couldn't find a doggo right now :(")
+
+    @commands.hybrid_command(name="joke", description="Get a random joke")
+    async def joke(self, ctx):
+        async with aiohttp.ClientSession() as session:
+            async with session.get('https://official-joke-api.appspot.com/random_joke') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    await ctx.send(f"**{data['setup']}**\n\n||{data['punchline']}|| :sob:")
+                else:
+                    await ctx.send("Oopsie! My joke book is empty right now :(")
+
+    @commands.hybrid_command(name="magic8ball", description="Ask the magic 8-ball a question")
+    async def magic8ball(self, ctx, *, question: str):
+        responses = [
+            "Yesss definitely!!", "For sure!!", "Without a doubt!",
+            "Hmmmm I think yes!", "You can count on it!",
+            "Maybe? ask again later", "Better not tell you now :3",
+            "Cannot predict now", "Don't count on it :(",
+            "My sources say noooo", "Very doubtful", "NOPE!"
+        ]
+        await ctx.send(f"🎱 **Question:** {question}\n**Answer:** {random.choice(responses)}")
+
+    @commands.hybrid_command(name="rps", description="Play Rock Paper Scissors with the bot")
+    @app_commands.describe(choice="Choose rock, paper, or scissors")
+    @app_commands.choices(choice=[
+        app_commands.Choice(name="rock", value="rock"),
+        app_commands.Choice(name="paper", value="paper"),
+        app_commands.Choice(name="scissors", value="scissors"),
+    ])
+    async def rps(self, ctx, choice: str):
+        choices = ['rock', 'paper', 'scissors']
+        bot_choice = random.choice(choices)
+
+        if choice == bot_choice:
+            result = "It's a tie!! :o"
+        elif (choice == 'rock' and bot_choice == 'scissors') or \
+                (choice == 'paper' and bot_choice == 'rock') or \
+                (choice == 'scissors' and bot_choice == 'paper'):
+            result = "You win!! :D"
+        else:
+            result = "I win!! hehe :3"
+
+        await ctx.send(f"You chose **{choice}**, I chose **{bot_choice}**. {result}")
+
+    @commands.hybrid_command(name="fact", description="Get a random useless fact")
+    async def fact(self, ctx):
+        async with aiohttp.ClientSession() as session:
+            async with session.get('https://uselessfacts.jsph.pl/api/v2/facts/random') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    await ctx.send(f"**Random Fact:** {data['text']} :D")
+                else:
+                    await ctx.send("Oopsie! My fact book is empty right now :(")
+
+    @commands.hybrid_command(name="secretfact", description="Get a super secret fact")
+    async def secretfact(self, ctx):
+        role = resolve_role(ctx.guild, self.services.guild_config.get(ctx.guild.id if ctx.guild else None)["secret_role"])
+        if role is None or role not in ctx.author.roles:
+            return await ctx.send("Uh oh, you need the special role to see these super secret facts :eyes:", ephemeral=True)
+
+        secret_facts = [
+            "When you shuffle a deck of cards, it's likely that your exact arrangement has never been seen before in human history!",
+            "The inventor of the frisbee was turned into a frisbee after he died! His ashes were molded into a frisbee!",
+            "Dolphins have names for each other and will respond when called!",
+            "The original purpose of bubble wrap was to be used as wallpaper!",
+            "Nintendo was founded in 1889, before the invention of cars or planes!",
+            "Did u know that u are a cutie:)"
+        ]
+        await ctx.send(f"**🔮 SUPER SECRET FACT I like this one:D :** {random.choice(secret_facts)} :D")
+
+    @commands.command(name="simpleguessgame", description="Play a simplified number guessing game")
+    async def simpleguessgame(self, ctx):
+        await ctx.send("I've picked a number between 1 and 100. Use /guess_number to make guesses!")
+        self.services.guess_games[ctx.author.id] = {'number': random.randint(1, 100), 'attempts': 0, 'max_attempts': 10}
+
+    @commands.hybrid_command(name="guess_number", description="Make a guess for the number game")
+    async def guess_number(self, ctx, number: int):
+        if ctx.author.id not in self.services.guess_games:
+            return await ctx.send("You don't have an active guessing game! Start one with /simpleguessgame")
+
+        game = self.services.guess_games[ctx.author.id]
+        game['attempts'] += 1
+
+        if number == game['number']:
+            await ctx.send(f"YAYYYY!!! :partying_face: You got it right in {game['attempts']} attempts! The number was indeed {game['number']}!")
+            del self.services.guess_games[ctx.author.id]
+        elif game['attempts'] >= game['max_attempts']:
+            await ctx.send(f"Awww you ran out of attempts :( The number was {game['number']}. Better luck next time!")
+            del self.services.guess_games[ctx.author.id]
+        elif number < game['number']:
+            await ctx.send(f"Too low! Try a higher number! :point_up: ({game['attempts']}/{game['max_attempts']} attempts)")
+        else:
+            await ctx.send(f"Too high! Try a lower number! :point_down: ({game['attempts']}/{game['max_attempts']} attempts)")
+
+    @commands.hybrid_command(name="flip", description="Flip a coin")
+    async def flip(self, ctx):
+        result = random.choice(["Heads", "Tails"])
+
+        heads_url = "https://i.imgur.com/jTGm7MF.png"
+        tails_url = "https://i.imgur.com/u1pmQMV.png"
+
+        embed = discord.Embed(
+            title="Coin Flip!",
+            description=f"The coin landed on... **{result}**! :o",
+            color=discord.Color.gold()
+        )
+
+        embed.set_image(url=heads_url if result == "Heads" else tails_url)
+
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="wyr", description="Would You Rather game")
+    async def wyr(self, ctx):
+        wyr_questions = [
+            ["Eat a pizza with pineapple", "Eat a burger with chocolate sauce"],
+            ["Have the ability to talk to animals", "Have the ability to speak all human languages"],
+            ["Be able to teleport anywhere", "Be able to read minds"],
+            ["Live in the future", "Live in the past"],
+            ["Always have to say everything on your mind", "Never speak again"],
+            ["Be famous for your talent", "Be incredibly rich but unknown"],
+            ["Never use social media again", "Never watch movies or TV shows again"],
+            ["Have unlimited food", "Have unlimited money"],
+            ["Be able to fly", "Be invisible whenever you want"],
+            ["Live underwater", "Live in space"],
+            ["Always be slightly too hot", "Always be slightly too cold"],
+            ["Have hands for feet", "Have feet for hands"],
+            ["Know how you will die", "Know when you will die"],
+            ["Be covered in fur", "Be covered in scales"],
+            ["Never sleep again", "Sleep for 12 hours every day and never feel tired"],
+            ["Be a famous actor", "Be a famous musician"],
+            ["Travel to the past", "Travel to the future"],
+            ["Lose the ability to read", "Lose the ability to speak"],
+            ["Give up your smartphone forever", "Give up dessert forever"],
+            ["Be 10 years older", "Be 10 years younger"],
+            ["Have super strength", "Have super speed"],
+            ["Always be overdressed", "Always be underdressed"],
+            ["Live without the internet", "Live without AC/heating"],
+            ["Be able to see 10 minutes into the future", "Be able to see 10 minutes into the past"],
+            ["Always have to tell the truth", "Always have to lie"],
+            ["Be fluent in all languages", "Be a master of all musical instruments"],
+            ["Have one real-life 'get out of jail free' card", "Have one real-life 'undo button'"],
+            ["Have all traffic lights turn green for you", "Never have to stand in line again"],
+            ["Save 100 strangers", "Save 1 loved one"],
+            ["Fight 1 horse-sized duck", "Fight 100 duck-sized horses"],
+            ["Have unlimited sushi", "Have unlimited tacos"],
+            ["Be a superhero", "Be a wizard"],
+            ["Live in a world with zombies", "Live in a world with aliens"],
+            ["Never have to clean again", "Never have to do laundry again"],
+            ["Be the funniest person alive", "Be the smartest person alive"],
+            ["Know when you'll die", "Know how you'll die"],
+            ["Win the lottery", "Live twice as long"],
+            ["Be famous", "Be anonymous forever"],
+            ["Always have bad WiFi", "Always have bad phone signal"],
+            ["Be a dragon", "Be a unicorn"]
+        ]
+
+        options = random.choice(wyr_questions)
+
+        embed = discord.Embed(
+            title="Would You Rather...? :3",
+            description="React to choose! :)",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="🅰️", value=f"Option A: {options[0]}", inline=False)
+        embed.add_field(name="🅱️", value=f"Option B: {options[1]}", inline=False)
+
+        message = await ctx.send(embed=embed)
+        message = await ctx.fetch_message(message.id)
+        await message.add_reaction("🅰️")
+        await message.add_reaction("🅱️")
+
+    @commands.hybrid_command(name="ship", description="Ship two users together") 
+    async def ship(self, ctx, user1: discord.Member, user2: discord.Member = None):
+        if user2 is None:
+            user2 = user1
+            user1 = ctx.author
+
+        if user1.id == user2.id:
+            ship_percentage = 100
+        else:
+            combined_id = str(min(user1.id, user2.id)) + str(max(user1.id, user2.id))
+            seed = int(combined_id) % 10000  
+            random.seed(seed)
+            ship_percentage = random.randint(0, 100)
+            random.seed() 
+
+        name1 = user1.display_name
+        name2 = user2.display_name
+        first_half = name1[:len(name1)//2]
+        second_half = name2[len(name2)//2:]
+        ship_name = first_half + second_half
+
+        if ship_percentage < 20:
+            color = discord.Color.red()
+            message = "Uh oh.. Maybe just be friends :("
+            emoji = "💔"
+        elif ship_percentage < 40:
+            color = discord.Color.orange()
+            message = "Hmm, could be better! :3"
+            emoji = "🧡"
+        elif ship_percentage < 60:
+            color = discord.Color.yellow()
+            message = "Ooooo ;) You might have something there!"
+            emoji = "💫"
+        elif ship_percentage < 80:
+            color = discord.Color.green()
+            message = "WOAHHHHH :o You two would be so cute together!!"
+            emoji = "💚"
+        elif ship_percentage < 100:
+            color = discord.Color.purple()
+            message = "WOWIE this is insane! You two are meant to be!!"
+            emoji = "💜"
+        else:
+            color = discord.Color.magenta()
+            message = "PERFECT MATCH!! TRUE LOVE!!"
+            emoji = "💞"
+
+        embed = discord.Embed(
+            title=f"{emoji} Relationship Calculator {emoji}",
+            description=f"**{user1.display_name}** + **{user2.display_name}** = **{ship_name}**",
+            color=color
+        )
+
+        embed.add_field(name="Compatibility", value=f"**{ship_percentage}%**", inline=True)
+        embed.add_field(name="Result", value=message, inline=True)
+
+        await ctx.send(embed=embed)
+
+async def setup(bot):
+    await bot.add_cog(Fun(bot))
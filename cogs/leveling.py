@@ -0,0 +1,184 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+import datetime
+import heapq
+import random
+import time
+
+from guild_config import resolve_role
+from levels import calculate_level, xp_for_level
+from seasons import lifetime_xp, season_xp, touch
+
+LEADERBOARD_SIZE = 10
+
+class Leveling(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.services = bot.services
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        if message.author.bot or message.guild is None:
+            return
+
+        # messages that show up while the XP store is still loading wait here instead of seeing an empty user_xp
+        await self.services.wait_until_warm()
+
+        settings = self.services.guild_config.get(message.guild.id)
+        user_xp = self.services.user_xp
+        user_id = str(message.author.id)
+
+        if settings["xp_cooldown"]:
+            key = (message.guild.id, message.author.id)
+            now = time.monotonic()
+            if now - self.services.xp_cooldowns.get(key, 0) < settings["xp_cooldown"]:
+                return
+            self.services.xp_cooldowns[key] = now
+
+        season = self.services.season_number
+        if user_id in user_xp:
+            print(f"Before update: User {user_id} has {user_xp[user_id]} XP")
+        else:
+            print(f"Before update: User {user_id} is new, starting with 0 XP")
+        entry = touch(user_xp, user_id, season)
+
+        # levels (and the level roles) go by the XP earned this season
+        old_level = calculate_level(entry["season_xp"])
+        old_xp = entry["season_xp"]
+
+        xp_gain = random.randint(settings["xp_min"], settings["xp_max"])
+        entry["xp"] += xp_gain
+        entry["season_xp"] += xp_gain
+
+        print(f"XP UPDATE: User {user_id} gained {xp_gain} XP in season {season}: {old_xp} -> {entry['season_xp']} ({entry['xp']} lifetime)")
+
+        self.services.xp_dirty = True
+
+        new_level = calculate_level(entry["season_xp"])
+
+        if new_level > old_level:
+            level_up_embed = discord.Embed(
+                title="🌟 LEVEL UP! 🌟",
+                description=f"WOOHOOOOOO {message.author.mention} just reached level **{new_level}** YIPEEE!!!",
+                color=discord.Color.gold()
+            )
+            level_up_embed.set_thumbnail(url=message.author.avatar.url if message.author.avatar else message.author.default_avatar.url)
+            await message.channel.send(embed=level_up_embed)
+
+            level_roles = settings["level_roles"]
+            if new_level in level_roles:
+                role_name = level_roles[new_level]
+                role = resolve_role(message.guild, role_name)
+
+                if role:
+                    await message.author.add_roles(role)
+                    await message.channel.send(f"✨YAYYYY {message.author.mention} has earned the **{role.name}** role! :D ✨")
+                else:
+                    print(f"Oh no, role {role_name} was not found in server {message.guild.name}")
+
+        self.services.mark("first message processed")
+
+    async def cog_before_invoke(self, ctx):
+        await self.services.wait_until_warm()
+
+    @commands.hybrid_command(name="level", description="Check your level or another user's level")
+    async def level(self, ctx, member: discord.Member = None):
+        member = member or ctx.author
+        user_id = str(member.id)
+
+        if user_id not in self.services.user_xp:
+            return await ctx.send(f"{member.name} hasn't earned any XP yet :(")
+
+        season = self.services.season_number
+        value = self.services.user_xp[user_id]
+        xp = season_xp(value, season)
+        level = calculate_level(xp)
+        next_level = level + 1
+        next_level_xp = xp_for_level(next_level)
+        current_level_xp = xp_for_level(level)
+
+        progress = (xp - current_level_xp) / (next_level_xp - current_level_xp) * 100 if next_level_xp > current_level_xp else 100
+
+        embed = discord.Embed(
+            title=f"{member.name}'s Level Stats :sparkles:",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Level", value=str(level), inline=True)
+        embed.add_field(name="XP", value=f"{xp}/{next_level_xp}", inline=True)
+        embed.add_field(name="Progress to Level {}".format(next_level), value=f"{progress:.1f}%", inline=True)
+        embed.add_field(name="Lifetime XP", value=str(lifetime_xp(value)), inline=True)
+        embed.set_footer(text=f"Season {season}")
+        embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
+
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="leaderboard", description="See who has the most XP in this server")
+    @app_commands.describe(scope="This season or all time")
+    @app_commands.choices(scope=[
+        app_commands.Choice(name="season", value="season"),
+        app_commands.Choice(name="lifetime", value="lifetime"),
+    ])
+    async def leaderboard(self, ctx, scope: str = "season"):
+        if ctx.guild is None:
+            return await ctx.send("The leaderboard only works inside a server!")
+        if scope not in ("season", "lifetime"):
+            return await ctx.send("The scope has to be season or lifetime!")
+
+        season = self.services.season_number
+        scores = []
+        for user_id, value in list(self.services.user_xp.items()):
+            member = ctx.guild.get_member(int(user_id))
+            if member is None:
+                continue
+            xp = season_xp(value, season) if scope == "season" else lifetime_xp(value)
+            if xp > 0:
+                scores.append((xp, member))
+        top = heapq.nlargest(LEADERBOARD_SIZE, scores, key=lambda score: score[0])
+
+        title = f"Season {season} Leaderboard :trophy:" if scope == "season" else "All Time Leaderboard :trophy:"
+        embed = discord.Embed(title=title, color=discord.Color.gold())
+        if not top:
+            embed.description = "Nobody has earned any XP yet :("
+        else:
+            medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+            embed.description = "\n".join(
+                f"{medals.get(place, f'**{place}.**')} {member.display_name} - {xp} XP (Level {calculate_level(xp)})"
+                for place, (xp, member) in enumerate(top, start=1)
+            )
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="season", description="See which leveling season it is")
+    async def season(self, ctx):
+        season = self.services.season
+        started_at = season.get("started_at")
+        embed = discord.Embed(
+            title=f"Season {season['number']} :calendar:",
+            description="Levels reset every season, but your lifetime XP sticks around forever! :D",
+            color=discord.Color.blue()
+        )
+        if started_at:
+            started = datetime.datetime.fromisoformat(started_at)
+            embed.add_field(name="Started", value=discord.utils.format_dt(started.astimezone(), style="R"), inline=True)
+        value = self.services.user_xp.get(str(ctx.author.id))
+        if value is not None:
+            embed.add_field(name="Your season XP", value=str(season_xp(value, season["number"])), inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="ranks", description="See available level ranks")
+    async def ranks(self, ctx):
+        embed = discord.Embed(
+            title="Level Ranks :trophy:",
+            description="Here are the special roles you can earn by leveling up!",
+            color=discord.Color.gold()
+        )
+
+        level_roles = self.services.guild_config.get(ctx.guild.id if ctx.guild else None)["level_roles"]
+        for level, role_name in sorted(level_roles.items()):
+            role = resolve_role(ctx.guild, role_name)
+            embed.add_field(name=f"Level {level}", value=role.name if role else role_name, inline=False)
+
+        await ctx.send(embed=embed)
+
+async def setup(bot):
+    await bot.add_cog(Leveling(bot))
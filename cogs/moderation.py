@@ -0,0 +1,42 @@
+from discord.ext import commands
+
+from guild_config import resolve_role, swear_pattern
+
+class Moderation(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.services = bot.services
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        if message.author == self.bot.user:
+            return
+
+        await self.services.guild_config.wait_until_ready()
+        swear_words = self.services.guild_config.get(message.guild.id if message.guild else None)["swear_words"]
+
+        pattern = swear_pattern(tuple(swear_words))
+        if pattern is not None and pattern.search(message.content):
+            await message.delete()
+            await message.channel.send(f"{message.author.mention} don't swear please:(")
+
+    @commands.hybrid_command(name="assign", description="Assign yourself the secret role")
+    async def assign(self, ctx):
+        role = resolve_role(ctx.guild, self.services.guild_config.get(ctx.guild.id)["secret_role"])
+        if role:
+            await ctx.author.add_roles(role)
+            await ctx.send(f"{ctx.author.mention} YAY U got the role: {role.name}!! :D")
+        else:
+            await ctx.send("Nooo something went wrong adding the role :(")
+
+    @commands.hybrid_command(name="remove", description="Remove the secret role from yourself")
+    async def remove(self, ctx):
+        role = resolve_role(ctx.guild, self.services.guild_config.get(ctx.guild.id)["secret_role"])
+        if role:
+            await ctx.author.remove_roles(role)
+            await ctx.send(f"{ctx.author.mention} Aw the role {role.name} has vanished:(")
+        else:
+            await ctx.send("Nooo something went wrong removing the role:(")
+
+async def setup(bot):
+    await bot.add_cog(Moderation(bot))
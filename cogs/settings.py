@@ -0,0 +1,186 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+import sys
+import traceback
+
+from guild_config import DEFAULTS, resolve_role
+
+# these always have to work, otherwise there's no way to turn things back on
+PROTECTED_COMMANDS = {"config", "help"}
+
+
+class CommandDisabledHere(commands.CheckFailure):
+    pass
+
+
+class Settings(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.services = bot.services
+
+    @property
+    def guild_config(self):
+        return self.services.guild_config
+
+    async def bot_check(self, ctx):
+        if ctx.guild is None or ctx.command is None:
+            return True
+        name = ctx.command.root_parent.name if ctx.command.root_parent else ctx.command.name
+        if name in self.guild_config.get(ctx.guild.id)["disabled_commands"]:
+            raise CommandDisabledHere(f"/{name} is turned off in this server")
+        return True
+
+    async def cog_check(self, ctx):
+        if ctx.guild is None:
+            raise commands.NoPrivateMessage()
+        if not ctx.author.guild_permissions.manage_guild:
+            raise commands.MissingPermissions(["manage_guild"])
+        return True
+
+    @commands.Cog.listener()
+    async def on_command_error(self, ctx, error):
+        if isinstance(error, CommandDisabledHere):
+            await ctx.send(f"Sorry, {error} :(", ephemeral=True)
+        elif isinstance(error, commands.MissingPermissions) and ctx.cog is self:
+            await ctx.send("You need the Manage Server permission to change my settings :(", ephemeral=True)
+        elif isinstance(error, commands.NoPrivateMessage) and ctx.cog is self:
+            await ctx.send("Settings can only be changed inside a server!")
+        elif not (ctx.command and ctx.command.has_error_handler()) and not (ctx.cog and ctx.cog.has_error_handler()):
+            # having this listener turns off discord.py's default error printing, so do that ourselves
+            print(f"Ignoring exception in command {ctx.command}:", file=sys.stderr)
+            traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
+
+    @commands.hybrid_group(name="config", description="Show or change this server's settings", fallback="show")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(manage_guild=True)
+    async def config(self, ctx):
+        settings = self.guild_config.get(ctx.guild.id)
+        overridden = self.guild_config.overrides(ctx.guild.id)
+
+        embed = discord.Embed(title=f"Settings for {ctx.guild.name} :gear:", color=discord.Color.blue())
+
+        role = resolve_role(ctx.guild, settings["secret_role"])
+        embed.add_field(name="Secret role", value=role.mention if role else f"{settings['secret_role']} (not found)", inline=False)
+
+        level_lines = []
+        for level, role_value in sorted(settings["level_roles"].items()):
+            role = resolve_role(ctx.guild, role_value)
+            level_lines.append(f"Level {level}: {role.mention if role else f'{role_value} (not found)'}")
+        embed.add_field(name="Level roles", value="\n".join(level_lines) or "None", inline=False)
+
+        embed.add_field(name="XP per message", value=f"{settings['xp_min']} - {settings['xp_max']}", inline=True)
+        embed.add_field(name="XP cooldown", value=f"{settings['xp_cooldown']}s", inline=True)
+        embed.add_field(name="Filtered words", value=", ".join(f"||{w}||" for w in settings["swear_words"]) or "None", inline=False)
+        embed.add_field(name="Disabled commands", value=", ".join(settings["disabled_commands"]) or "None", inline=False)
+        embed.set_footer(text=f"Changed from the defaults: {', '.join(sorted(overridden)) or 'nothing'}")
+
+        await ctx.send(embed=embed)
+
+    @config.command(name="xp", description="Set how much XP a message gives")
+    @app_commands.describe(minimum="Least XP per message", maximum="Most XP per message")
+    async def config_xp(self, ctx, minimum: int, maximum: int):
+        if minimum < 0 or maximum < minimum or maximum > 1000:
+            return await ctx.send("The XP range has to be between 0 and 1000 and the minimum can't be bigger than the maximum!")
+        await self.guild_config.update(ctx.guild.id, xp_min=minimum, xp_max=maximum)
+        await ctx.send(f"Messages now give **{minimum} - {maximum}** XP :D")
+
+    @config.command(name="cooldown", description="Set how many seconds someone has to wait between earning XP")
+    @app_commands.describe(seconds="Seconds between messages that earn XP (0 turns it off)")
+    async def config_cooldown(self, ctx, seconds: int):
+        if seconds < 0 or seconds > 3600:
+            return await ctx.send("The cooldown has to be between 0 and 3600 seconds!")
+        await self.guild_config.update(ctx.guild.id, xp_cooldown=seconds)
+        await ctx.send(f"XP cooldown set to **{seconds}s** :D")
+
+    @config.command(name="secretrole", description="Set the role /assign hands out")
+    async def config_secretrole(self, ctx, role: discord.Role):
+        await self.guild_config.update(ctx.guild.id, secret_role=str(role.id))
+        await ctx.send(f"The secret role is now {role.mention} :eyes:")
+
+    @config.command(name="levelrole", description="Give a role when someone reaches a level")
+    @app_commands.describe(level="The level", role="The role to give")
+    async def config_levelrole(self, ctx, level: int, role: discord.Role):
+        if level < 1:
+            return await ctx.send("The level has to be at least 1!")
+        level_roles = dict(self.guild_config.get(ctx.guild.id)["level_roles"])
+        level_roles[level] = str(role.id)
+        await self.guild_config.update(ctx.guild.id, level_roles=level_roles)
+        await ctx.send(f"Reaching level **{level}** now gives {role.mention} :D")
+
+    @config.command(name="removelevelrole", description="Stop giving a role for a level")
+    async def config_removelevelrole(self, ctx, level: int):
+        level_roles = dict(self.guild_config.get(ctx.guild.id)["level_roles"])
+        if level not in level_roles:
+            return await ctx.send(f"There's no role for level {level}!")
+        del level_roles[level]
+        await self.guild_config.update(ctx.guild.id, level_roles=level_roles)
+        await ctx.send(f"Level **{level}** doesn't give a role anymore")
+
+    @config.command(name="addword", description="Add a word to the filter")
+    async def config_addword(self, ctx, *, word: str):
+        word = " ".join(word.lower().split())
+        if not word:
+            return await ctx.send("You have to give me a word!", ephemeral=True)
+        swear_words = list(self.guild_config.get(ctx.guild.id)["swear_words"])
+        if word in swear_words:
+            return await ctx.send("That word is already filtered!", ephemeral=True)
+        swear_words.append(word)
+        await self.guild_config.update(ctx.guild.id, swear_words=swear_words)
+        await ctx.send(f"Added ||{word}|| to the filter", ephemeral=True)
+
+    @config.command(name="removeword", description="Remove a word from the filter")
+    async def config_removeword(self, ctx, *, word: str):
+        word = " ".join(word.lower().split())
+        swear_words = list(self.guild_config.get(ctx.guild.id)["swear_words"])
+        if word not in swear_words:
+            return await ctx.send("That word isn't filtered!", ephemeral=True)
+        swear_words.remove(word)
+        await self.guild_config.update(ctx.guild.id, swear_words=swear_words)
+        await ctx.send(f"Removed ||{word}|| from the filter", ephemeral=True)
+
+    @config.command(name="disable", description="Turn a command off in this server")
+    async def config_disable(self, ctx, command: str):
+        command = command.lower().lstrip("/!")
+        cmd = self.bot.get_command(command)
+        if cmd is None:
+            return await ctx.send(f"I don't have a command called {command}!")
+        # bot_check only looks at the top level command, so that's what gets stored (subcommands can't be turned off alone)
+        command = cmd.root_parent.name if cmd.root_parent else cmd.name
+        if command in PROTECTED_COMMANDS:
+            return await ctx.send(f"Nice try, but /{command} can't be turned off :p")
+        disabled = list(self.guild_config.get(ctx.guild.id)["disabled_commands"])
+        if command not in disabled:
+            disabled.append(command)
+            await self.guild_config.update(ctx.guild.id, disabled_commands=disabled)
+        await ctx.send(f"/{command} is now turned off in this server")
+
+    @config.command(name="enable", description="Turn a command back on in this server")
+    async def config_enable(self, ctx, command: str):
+        command = command.lower().lstrip("/!")
+        cmd = self.bot.get_command(command)
+        if cmd is not None:
+            command = cmd.root_parent.name if cmd.root_parent else cmd.name
+        disabled = list(self.guild_config.get(ctx.guild.id)["disabled_commands"])
+        if command not in disabled:
+            return await ctx.send(f"/{command} isn't turned off!")
+        disabled.remove(command)
+        await self.guild_config.update(ctx.guild.id, disabled_commands=disabled)
+        await ctx.send(f"/{command} is turned back on :D")
+
+    @config.command(name="reset", description="Reset one setting (or all of them) back to the defaults")
+    @app_commands.describe(setting="The setting to reset, leave empty to reset everything")
+    @app_commands.choices(setting=[app_commands.Choice(name=key, value=key) for key in DEFAULTS])
+    async def config_reset(self, ctx, setting: str = None):
+        if setting is not None and setting not in DEFAULTS:
+            return await ctx.send(f"I don't have a setting called {setting}! Try one of: {', '.join(DEFAULTS)}")
+        if setting in ("xp_min", "xp_max"):
+            await self.guild_config.reset(ctx.guild.id, "xp_min", "xp_max")
+        elif setting:
+            await self.guild_config.reset(ctx.guild.id, setting)
+        else:
+            await self.guild_config.reset(ctx.guild.id)
+        await ctx.send(f"Reset {setting or 'all settings'} back to the defaults :D")
+
+async def setup(bot):
+    await bot.add_cog(Settings(bot))
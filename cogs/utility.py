@@ -0,0 +1,87 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+import asyncio
+
+class Utility(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.services = bot.services
+
+    @commands.hybrid_command(name="hello", description="Get a friendly hello from the bot")
+    async def hello(self, ctx):
+        await ctx.send(f"HIII {ctx.author.mention}!!! :D")
+
+    @commands.hybrid_command(name="dm", description="Have the bot DM you a message")
+    async def dm(self, ctx, *, msg: str):
+        await ctx.author.send(f"LOOOKKKK u said: {msg} :D")
+        await ctx.send("Check your DMs! :envelope_with_arrow:")
+
+    @commands.hybrid_command(name="poll", description="Create a simple yes/no poll")
+    async def poll(self, ctx, *, question: str):
+        embed = discord.Embed(title="Question:D", description=question)
+        message = await ctx.send(embed=embed)
+
+        message = await ctx.fetch_message(message.id)
+        await message.add_reaction("👍")
+        await message.add_reaction("👎")
+
+    @commands.hybrid_command(name="avatar", description="Show a user's avatar")
+    async def avatar(self, ctx, member: discord.Member = None):
+        member = member or ctx.author
+        embed = discord.Embed(title=f"{member.name}'s Avatar", color=discord.Color.purple())
+        embed.set_image(url=member.avatar.url if member.avatar else member.default_avatar.url)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="remind", description="Set a reminder")
+    @app_commands.describe(
+        time_value="Time amount",
+        time_unit="Time unit (seconds, minutes, hours, days)",
+        reminder="What to remind you about"
+    )
+    @app_commands.choices(time_unit=[
+        app_commands.Choice(name="seconds", value="seconds"),
+        app_commands.Choice(name="minutes", value="minutes"),
+        app_commands.Choice(name="hours", value="hours"),
+        app_commands.Choice(name="days", value="days"),
+    ])
+    async def remind(self, ctx, time_value: int, time_unit: str, *, reminder: str):
+        user = ctx.author
+
+        time_convert = {"seconds": 1, "minutes": 60, "hours": 3600, "days": 86400}
+        seconds = time_value * time_convert[time_unit]
+
+        embed = discord.Embed(
+            title="Reminder Set! :3",
+            description=f"I'll remind you about: **{reminder} :D**",
+            color=discord.Color.blue()
+        )
+
+        time_text = f"{time_value} {time_unit}"
+
+        embed.add_field(name="⏱️ Time", value=time_text)
+        await ctx.send(embed=embed)
+
+        # the reminder runs as its own task tracked by the services so reloading this cog doesn't drop it
+        self.services.track_reminder(asyncio.create_task(deliver_reminder(user, ctx.channel, reminder, seconds)))
+
+async def deliver_reminder(user, channel, reminder, seconds):
+    await asyncio.sleep(seconds)
+
+    reminder_embed = discord.Embed(
+        title="REMINDER!! ",
+        description=f"{reminder}",
+        color=discord.Color.red()
+    )
+
+    try:
+        await user.send(f"Heyy {user.mention}, here's your reminder!! :3", embed=reminder_embed)
+    except discord.errors.Forbidden:
+
+        try:
+            await channel.send(f"Heyy {user.mention}, here's your reminder!! :3", embed=reminder_embed)
+        except:
+            pass
+
+async def setup(bot):
+    await bot.add_cog(Utility(bot))
@@ -0,0 +1,35 @@
+secret_role = "Cutie"
+
+XP_FILE = "user_xp.json"
+GUILD_CONFIG_FILE = "guild_config.json"
+SEASON_FILE = "season.json"
+SEASON_ARCHIVE_FILE = "season_archive.json"
+
+# XP saved before seasons existed counts as this season
+FIRST_SEASON = 1
+
+level_roles = {
+    5: "Level 5",
+    10: "level 10",
+    20: "level 20",
+    50: "level 50"
+}
+
+# if u want to change or add more swearwords add them in the list/array below. if u want to remove them just delete them from the list/array below.
+swear_words = [
+    "job application", "hawk tuah", "hawktuah", "cancer"
+]
+
+# defaults for every server, admins can change them per server with /config
+XP_GAIN_RANGE = (5, 15)
+XP_COOLDOWN = 0
+
+# extensions that get loaded on startup, reload them with !reload <name> (bot owner only)
+EXTENSIONS = [
+    "cogs.leveling",
+    "cogs.fun",
+    "cogs.moderation",
+    "cogs.utility",
+    "cogs.admin",
+    "cogs.settings",
+]
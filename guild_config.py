@@ -0,0 +1,206 @@
+import asyncio
+import copy
+import functools
+import re
+import traceback
+
+import discord
+
+from config import secret_role, level_roles, swear_words, XP_GAIN_RANGE, XP_COOLDOWN
+from storage import load_guild_config, save_guild_config, watch_guild_configs
+
+DEFAULTS = {
+    "secret_role": secret_role,
+    "level_roles": dict(level_roles),
+    "swear_words": list(swear_words),
+    "xp_min": XP_GAIN_RANGE[0],
+    "xp_max": XP_GAIN_RANGE[1],
+    "xp_cooldown": XP_COOLDOWN,
+    "disabled_commands": [],
+}
+
+# Firebase drops empty lists/dicts, which would quietly bring the defaults back, so empty ones are stored as False
+EMPTY = False
+
+
+def to_stored(key, value):
+    """Turn a setting into the form it gets saved in (string keys, no empty collections)"""
+    if key == "level_roles":
+        value = {str(level): str(role) for level, role in value.items()}
+    elif isinstance(value, (list, tuple)):
+        value = list(value)
+    if isinstance(value, (dict, list)) and not value:
+        return EMPTY
+    return value
+
+
+def from_stored(key, value):
+    """Turn a saved setting back into what the cogs use"""
+    if key == "level_roles":
+        if value is EMPTY or value is None:
+            return {}
+        # Firebase hands back dicts with small numeric keys as lists
+        if isinstance(value, list):
+            value = {i: role for i, role in enumerate(value) if role is not None}
+        return {int(level): role for level, role in value.items()}
+    if key in ("swear_words", "disabled_commands"):
+        if value is EMPTY or value is None:
+            return []
+        if isinstance(value, dict):
+            value = value.values()
+        return [v for v in value if v is not None]
+    return value
+
+
+def merge(overrides):
+    settings = copy.deepcopy(DEFAULTS)
+    for key, value in (overrides or {}).items():
+        if key in DEFAULTS:
+            settings[key] = from_stored(key, value)
+    return settings
+
+
+@functools.lru_cache(maxsize=256)
+def swear_pattern(words):
+    """One regex for a guild's filter list (pass it as a tuple), phrases match across any whitespace"""
+    words = [w for w in words if w.strip()]
+    if not words:
+        return None
+    alternatives = "|".join(r"\s+".join(re.escape(part) for part in word.split()) for word in words)
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)", re.IGNORECASE)
+
+
+def resolve_role(guild, value):
+    """Roles can be configured by ID or by name"""
+    if guild is None or value is None:
+        return None
+    value = str(value)
+    if value.isdigit():
+        role = guild.get_role(int(value))
+        if role:
+            return role
+    return discord.utils.get(guild.roles, name=value)
+
+
+class GuildConfigStore:
+    """Per-guild settings with an in-memory read-through cache.
+
+    ``get`` never touches the database: it merges the guild's stored overrides with the defaults the first time a
+    guild is asked for and keeps the result until something changes. Changes made through ``update``/``reset`` or
+    pushed by the backend drop the cached entry so the next read rebuilds it.
+    """
+
+    def __init__(self):
+        self._overrides = {}
+        self._cache = {}
+        self.ready = asyncio.Event()
+        self.listener = None
+        # one lock per guild so its saves reach the backend in order, the newest snapshot always lands last
+        self._save_locks = {}
+        # refetches started from listener events, kept here so they don't get garbage collected halfway
+        self._refetches = set()
+
+    async def wait_until_ready(self):
+        if not self.ready.is_set():
+            await self.ready.wait()
+
+    def load_all(self, overrides):
+        self._overrides = {str(guild_id): dict(data) for guild_id, data in (overrides or {}).items() if isinstance(data, dict)}
+        self._cache.clear()
+
+    def get(self, guild_id):
+        """Settings for a guild, ``None`` (DMs) gets the defaults. Don't modify what you get back!"""
+        guild_id = str(guild_id) if guild_id is not None else None
+        settings = self._cache.get(guild_id)
+        if settings is None:
+            settings = self._cache[guild_id] = merge(self._overrides.get(guild_id))
+        return settings
+
+    def overrides(self, guild_id):
+        return dict(self._overrides.get(str(guild_id), {}))
+
+    def invalidate(self, guild_id=None):
+        if guild_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(guild_id), None)
+
+    async def update(self, guild_id, **changes):
+        """Change some settings for a guild and save them, one write no matter how many settings changed"""
+        unknown = set(changes) - set(DEFAULTS)
+        if unknown:
+            raise KeyError(", ".join(sorted(unknown)))
+        guild_id = str(guild_id)
+        overrides = self._overrides.setdefault(guild_id, {})
+        for key, value in changes.items():
+            overrides[key] = to_stored(key, value)
+        self.invalidate(guild_id)
+        await self._save(guild_id)
+
+    async def reset(self, guild_id, *keys):
+        """Go back to the defaults for the given settings, or for everything if none are given"""
+        guild_id = str(guild_id)
+        overrides = self._overrides.pop(guild_id, {})
+        if keys:
+            for key in keys:
+                overrides.pop(key, None)
+            if overrides:
+                self._overrides[guild_id] = overrides
+        else:
+            overrides = {}
+        self.invalidate(guild_id)
+        await self._save(guild_id)
+
+    async def _save(self, guild_id):
+        lock = self._save_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            # snapshot inside the lock, so a save that had to wait writes the latest state and not an older one
+            await asyncio.to_thread(save_guild_config, guild_id, dict(self._overrides.get(guild_id, {})))
+
+    def on_remote_change(self, event_type, path, data):
+        """Called (on the bot's loop) when the backend reports a change under /guild_config"""
+        parts = [p for p in path.split("/") if p]
+        if not parts:
+            if event_type == "put":
+                self.load_all(data)
+            elif isinstance(data, dict):
+                for guild_id, guild_data in data.items():
+                    self._set_remote(guild_id, guild_data)
+            return
+
+        guild_id = parts[0]
+        if len(parts) == 1 and event_type == "put":
+            self._set_remote(guild_id, data)
+        else:
+            # something deeper than a whole guild changed, just read that guild again
+            self.invalidate(guild_id)
+            task = asyncio.create_task(self._refetch(guild_id))
+            self._refetches.add(task)
+            task.add_done_callback(self._refetches.discard)
+
+    def _set_remote(self, guild_id, data):
+        if isinstance(data, dict):
+            self._overrides[str(guild_id)] = dict(data)
+        else:
+            self._overrides.pop(str(guild_id), None)
+        self.invalidate(guild_id)
+
+    async def _refetch(self, guild_id):
+        try:
+            data = await asyncio.to_thread(load_guild_config, guild_id)
+            self._set_remote(guild_id, data)
+        except Exception as e:
+            print(f"Error refreshing config for guild {guild_id}: {e}")
+            traceback.print_exc()
+
+    def watch(self, loop):
+        """Start listening for backend changes, they get handed over to the bot's loop"""
+        def callback(event):
+            loop.call_soon_threadsafe(self.on_remote_change, event.event_type, event.path, event.data)
+
+        self.listener = watch_guild_configs(callback)
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
@@ -0,0 +1,5 @@
+def calculate_level(xp):
+    return int((xp / 100) ** 0.5)
+
+def xp_for_level(level):
+    return int(level ** 2 * 100)
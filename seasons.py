@@ -0,0 +1,132 @@
+import asyncio
+import datetime
+import heapq
+import traceback
+
+from config import FIRST_SEASON
+from storage import save_season, save_season_archive
+
+# how many users the archiver looks at before giving the event loop a turn
+ARCHIVE_CHUNK_SIZE = 500
+ARCHIVE_TOP_USERS = 10
+
+# Every user entry in user_xp looks like
+#   {"xp": lifetime XP, "season": season the entry was last touched in, "season_xp": XP earned that season,
+#    "last_season": the season before that, "last_season_xp": XP earned in it}
+# Starting a new season only bumps the season number. A user's entry gets rolled over the first time they're touched
+# in the new season, and keeping the last season around means the archiver can still read it afterwards.
+
+
+def new_season(number):
+    return {"number": number, "started_at": datetime.datetime.now().isoformat()}
+
+
+def normalize(value):
+    """Turn a stored entry into the season format, XP saved before seasons existed was a plain number"""
+    if isinstance(value, dict):
+        return value
+    return {"xp": value or 0, "season": FIRST_SEASON, "season_xp": value or 0}
+
+
+def touch(user_xp, user_id, season):
+    """Get a user's entry for writing, rolling it over to the current season if this is its first time in it"""
+    entry = user_xp.get(user_id)
+    if entry is None:
+        entry = {"xp": 0, "season": season, "season_xp": 0}
+    else:
+        entry = normalize(entry)
+        # only ever roll forward, if the season state couldn't be loaded we may be behind what's stored
+        if entry["season"] < season:
+            print(f"Rolling user {user_id} over from season {entry['season']} to season {season}")
+            entry = {
+                "xp": entry["xp"],
+                "season": season,
+                "season_xp": 0,
+                "last_season": entry["season"],
+                "last_season_xp": entry["season_xp"],
+            }
+    user_xp[user_id] = entry
+    return entry
+
+
+def season_xp(value, season):
+    """XP a user earned in a season, without rolling anything over"""
+    entry = normalize(value)
+    if entry["season"] == season:
+        return entry["season_xp"]
+    if entry.get("last_season") == season:
+        return entry.get("last_season_xp", 0)
+    return 0
+
+
+def lifetime_xp(value):
+    return normalize(value)["xp"]
+
+
+async def start_new_season(services):
+    """Move on to the next season. This is O(1), users roll over lazily and the archive is built in the background"""
+    old = services.season
+    season = new_season(old["number"] + 1)
+    season["pending_archive"] = old["number"]
+    season["previous_started_at"] = old["started_at"]
+    services.season = season
+    await asyncio.to_thread(save_season, season)
+    print(f"Season {season['number']} started")
+    start_archive(services)
+    return season
+
+
+def start_archive(services):
+    if services.season.get("pending_archive") is None:
+        return
+    if services.archive_task is not None and not services.archive_task.done():
+        return
+    if not services.xp_loaded:
+        # archiving from an XP store that didn't load would save an empty summary over the real one
+        print(f"XP data isn't loaded, season {services.season['pending_archive']} will be archived after the next restart")
+        return
+    services.archive_task = asyncio.create_task(archive_season(services))
+
+
+async def archive_season(services):
+    number = services.season["pending_archive"]
+    print(f"Archiving season {number}...")
+    try:
+        user_ids = list(services.user_xp)
+        top = []
+        participants = 0
+        total_xp = 0
+        for start in range(0, len(user_ids), ARCHIVE_CHUNK_SIZE):
+            for user_id in user_ids[start:start + ARCHIVE_CHUNK_SIZE]:
+                value = services.user_xp.get(user_id)
+                if value is None:
+                    continue
+                xp = season_xp(value, number)
+                if xp <= 0:
+                    continue
+                participants += 1
+                total_xp += xp
+                if len(top) < ARCHIVE_TOP_USERS:
+                    heapq.heappush(top, (xp, user_id))
+                else:
+                    heapq.heappushpop(top, (xp, user_id))
+            await asyncio.sleep(0)
+
+        summary = {
+            "season": number,
+            "started_at": services.season.get("previous_started_at"),
+            "ended_at": services.season["started_at"],
+            "participants": participants,
+            "total_xp": total_xp,
+            "top": [{"user_id": user_id, "xp": xp} for xp, user_id in sorted(top, reverse=True)],
+        }
+        await asyncio.to_thread(save_season_archive, number, summary)
+
+        if services.season.get("pending_archive") == number:
+            services.season = {key: value for key, value in services.season.items() if key not in ("pending_archive", "previous_started_at")}
+            await asyncio.to_thread(save_season, services.season)
+        print(f"Archived season {number}: {participants} users, {total_xp} XP")
+    except Exception as e:
+        # pending_archive is left alone, so the next warm-up tries this season again
+        print(f"Error archiving season {number}, it will be retried after the next restart: {e}")
+        traceback.print_exc()
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from config import FIRST_SEASON
+from guild_config import GuildConfigStore
+
+
+class Services:
+    """Shared bot state. It lives on ``bot.services`` and not inside a cog, so it survives extension reloads."""
+
+    def __init__(self, started_at=None):
+        self.user_xp = {}
+        # XP only gets saved by periodic_save (and on shutdown), never on the message path
+        self.xp_dirty = False
+        # False if loading the XP data failed, user_xp is then only what was earned since startup
+        self.xp_loaded = False
+        self.xp_save_lock = asyncio.Lock()
+        self.season = {"number": FIRST_SEASON, "started_at": None}
+        self.archive_task = None
+        # False if the stored season couldn't be read at startup, then nothing may save a new one over it
+        self.season_loaded = False
+        self.guild_config = GuildConfigStore()
+        # (guild_id, user_id) -> when that user last earned XP there, for the per-guild XP cooldown
+        self.xp_cooldowns = {}
+        self.guess_games = {}
+        self.reminders = set()
+        self.save_task = None
+        self.warmup_task = None
+        # set once the XP store is loaded, anything that reads or writes XP waits for this
+        self.xp_ready = asyncio.Event()
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.phases = {}
+
+    @property
+    def season_number(self):
+        return self.season["number"]
+
+    def prune_xp_cooldowns(self):
+        """Forget cooldowns that already ran out, otherwise every user who ever earned XP stays in here"""
+        now = time.monotonic()
+        self.xp_cooldowns = {
+            key: last for key, last in self.xp_cooldowns.items()
+            if now - last < self.guild_config.get(key[0])["xp_cooldown"]
+        }
+
+    def track_reminder(self, task):
+        """Keep a pending reminder alive across reloads and forget it once it fired"""
+        self.reminders.add(task)
+        task.add_done_callback(self.reminders.discard)
+        return task
+
+    async def wait_until_warm(self):
+        """Hold the caller until the XP store and the guild configs have been loaded"""
+        await self.guild_config.wait_until_ready()
+        if not self.xp_ready.is_set():
+            await self.xp_ready.wait()
+
+    def mark(self, phase):
+        """Record how long after process start a startup phase finished, only the first time it happens"""
+        if phase in self.phases:
+            return
+        elapsed = (time.perf_counter() - self.started_at) * 1000
+        self.phases[phase] = elapsed
+        print(f"[startup] {phase}: {elapsed:.0f}ms")
@@ -0,0 +1,263 @@
+import os
+import json
+import datetime
+import asyncio
+import base64
+import time
+import sys
+import threading
+import traceback
+
+from config import XP_FILE, GUILD_CONFIG_FILE, SEASON_FILE, SEASON_ARCHIVE_FILE
+
+# saves run in worker threads, so the read-modify-write of the shared local json files has to be serialized
+_local_file_lock = threading.Lock()
+
+# firebase_admin is slow to import, so it only gets imported once we know there are credentials to use
+_firebase_db = None
+
+def firebase_db():
+    """The firebase_admin db module, or None if Firebase isn't initialized"""
+    return _firebase_db
+
+def init_firebase():
+    global _firebase_db
+    if _firebase_db is not None:
+        return
+    try:
+        if os.path.exists('firebase-key.json'):
+            print("Initializing Firebase with local key file...")
+            key = 'firebase-key.json'
+        else:
+            firebase_key_json = os.getenv('FIREBASE_KEY_JSON')
+            if not firebase_key_json:
+                print("No Firebase credentials found - XP data will not persist between restarts!")
+                return
+            print("Initializing Firebase with environment key...")
+            key = json.loads(base64.b64decode(firebase_key_json).decode('utf-8'))
+
+        import firebase_admin
+        from firebase_admin import credentials
+        from firebase_admin import db
+        firebase_admin.initialize_app(credentials.Certificate(key), {
+            'databaseURL': os.getenv('FIREBASE_DB_URL')
+        })
+        _firebase_db = db
+        print(f"Firebase initialized with database URL: {os.getenv('FIREBASE_DB_URL')}")
+    except Exception as e:
+        print(f"Error initializing Firebase: {e}")
+
+def load_xp_data(services):
+    try:
+        db = firebase_db()
+        if db is not None:
+            print("Loading XP data from Firebase...")
+            xp_ref = db.reference('/xp_data')
+            
+            firebase_data = xp_ref.get()
+            if firebase_data:
+                services.user_xp = firebase_data
+                print(f"Successfully loaded XP data for {len(services.user_xp)} users from Firebase")
+            else:
+                print("No XP data found in Firebase, starting fresh")
+                services.user_xp = {}
+        else:
+            print("Firebase not initialized, trying to load from local file...")
+            if os.path.exists(XP_FILE):
+                with open(XP_FILE, 'r') as f:
+                    content = f.read().strip()
+                    if content: 
+                        services.user_xp = json.loads(content)
+                        print(f"Loaded XP data for {len(services.user_xp)} users from local file")
+                    else:
+                        print("XP file exists but is empty, starting fresh")
+                        services.user_xp = {}
+            else:
+                print(f"XP file not found at {XP_FILE}, starting fresh")
+                services.user_xp = {}
+        services.xp_loaded = True
+    except Exception as e:
+        print(f"Error loading XP data: {e}")
+        traceback.print_exc()  
+        services.user_xp = {}
+
+def save_xp_data(user_xp):
+    try:
+        db = firebase_db()
+        if db is not None:
+            xp_ref = db.reference('/xp_data')
+            
+            print(f"About to save XP data: {len(user_xp)} users with data: {json.dumps(user_xp)[:100]}...")
+            
+            def transaction_update(current_data):
+                if current_data is None:
+                    return user_xp
+                for user_id, xp in user_xp.items():
+                    current_data[user_id] = xp
+                return current_data
+            
+            try:
+                xp_ref.transaction(transaction_update)
+                print(f"Successfully used transaction to save XP data for {len(user_xp)} users to Firebase")
+            except Exception as e:
+                print(f"Transaction failed: {e}, falling back to direct set")
+                xp_ref.set(user_xp)
+                
+            time.sleep(1)  
+            verification = xp_ref.get()
+            if verification:
+                all_verified = True
+                for user_id, xp in user_xp.items():
+                    if user_id not in verification or verification[user_id] != xp:
+                        all_verified = False
+                        print(f"Verification failed for user {user_id}: expected {xp}, got {verification.get(user_id, 'missing')}")
+                
+                if all_verified:
+                    print("Firebase save verified successfully!")
+                else:
+                    print("Firebase save verification partially failed!")
+            else:
+                print("Firebase save verification completely failed - no data returned!")
+        
+        with open(XP_FILE, 'w') as f:
+            json.dump(user_xp, f, indent=2)
+            print(f"Saved XP data backup to local file")
+            
+        print(f"Current user_xp content (first 3 entries):")
+        entries = 0
+        for user_id, xp in user_xp.items():
+            if entries < 3:  
+                print(f"  User {user_id}: {xp} XP")
+                entries += 1
+            
+    except Exception as e:
+        print(f"Error saving XP data: {e}", file=sys.stderr)
+        traceback.print_exc() 
+        try:
+            with open(XP_FILE, 'w') as f:
+                json.dump(user_xp, f)
+                print(f"Saved XP data to local file after Firebase failure")
+        except Exception as e2:
+            print(f"Failed to save XP data anywhere: {e2}", file=sys.stderr)
+            traceback.print_exc()
+
+def _read_local_json(path):
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            content = f.read().strip()
+            if content:
+                return json.loads(content)
+    return None
+
+def _read_local_guild_configs():
+    return _read_local_json(GUILD_CONFIG_FILE) or {}
+
+def load_guild_configs():
+    """Every guild's stored config overrides, keyed by guild ID"""
+    try:
+        db = firebase_db()
+        if db is not None:
+            data = db.reference('/guild_config').get() or {}
+            print(f"Loaded config for {len(data)} guild(s) from Firebase")
+        else:
+            data = _read_local_guild_configs()
+            print(f"Loaded config for {len(data)} guild(s) from local file")
+        return data
+    except Exception as e:
+        print(f"Error loading guild configs: {e}")
+        traceback.print_exc()
+        return {}
+
+def load_guild_config(guild_id):
+    db = firebase_db()
+    if db is not None:
+        return db.reference(f'/guild_config/{guild_id}').get()
+    return _read_local_guild_configs().get(str(guild_id))
+
+def save_guild_config(guild_id, overrides):
+    guild_id = str(guild_id)
+    try:
+        db = firebase_db()
+        if db is not None:
+            ref = db.reference(f'/guild_config/{guild_id}')
+            if overrides:
+                ref.set(overrides)
+            else:
+                ref.delete()
+            print(f"Saved config for guild {guild_id} to Firebase")
+
+        with _local_file_lock:
+            data = _read_local_guild_configs()
+            if overrides:
+                data[guild_id] = overrides
+            else:
+                data.pop(guild_id, None)
+            with open(GUILD_CONFIG_FILE, 'w') as f:
+                json.dump(data, f, indent=2)
+    except Exception as e:
+        print(f"Error saving config for guild {guild_id}: {e}", file=sys.stderr)
+        traceback.print_exc()
+
+def watch_guild_configs(callback):
+    """Listen for changes under /guild_config, returns the listener (or None without Firebase)"""
+    db = firebase_db()
+    if db is None:
+        return None
+    try:
+        return db.reference('/guild_config').listen(callback)
+    except Exception as e:
+        print(f"Error listening for guild config changes: {e}")
+        traceback.print_exc()
+        return None
+
+def load_season():
+    """The current season state, or None if seasons were never started. Read errors are raised, not swallowed"""
+    db = firebase_db()
+    if db is not None:
+        return db.reference('/season').get()
+    return _read_local_json(SEASON_FILE)
+
+def save_season(season):
+    try:
+        db = firebase_db()
+        if db is not None:
+            db.reference('/season').set(season)
+            print(f"Saved season {season['number']} to Firebase")
+        with open(SEASON_FILE, 'w') as f:
+            json.dump(season, f, indent=2)
+    except Exception as e:
+        print(f"Error saving season: {e}", file=sys.stderr)
+        traceback.print_exc()
+
+def save_season_archive(number, summary):
+    """Store a season's summary. Errors are raised so the season stays pending and gets archived again later"""
+    db = firebase_db()
+    if db is not None:
+        db.reference(f'/season_archive/{number}').set(summary)
+        print(f"Saved archive for season {number} to Firebase")
+    with _local_file_lock:
+        archive = _read_local_json(SEASON_ARCHIVE_FILE) or {}
+        archive[str(number)] = summary
+        with open(SEASON_ARCHIVE_FILE, 'w') as f:
+            json.dump(archive, f, indent=2)
+
+async def flush_xp_data(services):
+    """Save a snapshot of the XP data in a worker thread so the event loop never waits on Firebase"""
+    async with services.xp_save_lock:
+        services.xp_dirty = False
+        snapshot = {user_id: dict(value) if isinstance(value, dict) else value for user_id, value in services.user_xp.items()}
+        await asyncio.to_thread(save_xp_data, snapshot)
+
+async def periodic_save(services):
+    """Periodically save XP data"""
+    while True:
+        try:
+            await asyncio.sleep(60)  
+            services.prune_xp_cooldowns()
+            if services.xp_dirty:
+                print(f"Performing periodic XP data save at {datetime.datetime.now()}")
+                await flush_xp_data(services)
+                print(f"Periodic save completed at {datetime.datetime.now()}")
+        except Exception as e:
+            print(f"Error in periodic save: {e}")
+            traceback.print_exc()